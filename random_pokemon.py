@@ -1,31 +1,107 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageTk
 from io import BytesIO
 import random
-import json
+import pickle
 import os
+import sqlite3
 import concurrent.futures
-from typing import List, Dict, Optional, Set, Tuple
+import itertools
+from typing import Callable, FrozenSet, Iterator, List, Dict, Optional, Tuple
 import threading
 import time
 
 # Cache directories
 CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
-SPRITE_CACHE_DIR = os.path.join(CACHE_DIR, 'sprites')
-DATA_CACHE_FILE = os.path.join(CACHE_DIR, 'pokemon_data.json')
-SPECIES_CACHE_FILE = os.path.join(CACHE_DIR, 'species_data.json')
+SPRITE_DB_FILE = os.path.join(CACHE_DIR, 'sprites.db')
+DATA_CACHE_FILE = os.path.join(CACHE_DIR, 'pokemon_data.pkl')
+SPECIES_CACHE_FILE = os.path.join(CACHE_DIR, 'species_data.pkl')
+EVOLUTION_CACHE_FILE = os.path.join(CACHE_DIR, 'evolution_data.pkl')
 
-# Ensure cache directories exist
-os.makedirs(SPRITE_CACHE_DIR, exist_ok=True)
+# Ensure cache directory exists
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+# Shared HTTP session so all PokeAPI and sprite requests reuse keep-alive connections
+REQUEST_TIMEOUT = 10
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Pokedex ID range (inclusive) of each generation
+GEN_RANGES = {
+    1: (1, 151),
+    2: (152, 251),
+    3: (252, 386),
+    4: (387, 493),
+    5: (494, 649),
+    6: (650, 721),
+    7: (722, 809),
+    8: (810, 905),
+    9: (906, 1025)
+}
+
+# Legendary and mythical Pokemon (is_legendary or is_mythical in PokeAPI species data, #1-1025)
+LEGENDARY_IDS: FrozenSet[int] = frozenset({
+    144, 145, 146, 150, 151,
+    243, 244, 245, 249, 250, 251,
+    377, 378, 379, 380, 381, 382, 383, 384, 385, 386,
+    480, 481, 482, 483, 484, 485, 486, 487, 488, 489, 490, 491, 492, 493,
+    494, 638, 639, 640, 641, 642, 643, 644, 645, 646, 647, 648, 649,
+    716, 717, 718, 719, 720, 721,
+    772, 773, 785, 786, 787, 788, 789, 790, 791, 792, 800, 801, 802, 807, 808, 809,
+    888, 889, 890, 891, 892, 893, 894, 895, 896, 897, 898, 905,
+    1001, 1002, 1003, 1004, 1007, 1008, 1014, 1015, 1016, 1017, 1024, 1025
+})
+
+# The 18 Pokemon types, each mapped to one bit of a type mask
+TYPE_NAMES = [
+    'normal', 'fighting', 'flying', 'poison', 'ground', 'rock',
+    'bug', 'ghost', 'steel', 'fire', 'water', 'grass',
+    'electric', 'psychic', 'ice', 'dragon', 'dark', 'fairy'
+]
+TYPE_BIT = {name: 1 << i for i, name in enumerate(TYPE_NAMES)}
+
+# Long-lived worker pool for all blocking HTTP and disk I/O
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix="pokeapi")
+
+# Number of random candidates fetched in parallel per round trip
+PROBE_BATCH_SIZE = 6
+
+# Minimum delay between background cache flushes (seconds)
+CACHE_FLUSH_INTERVAL = 30
 
 # Initialize caches
 pokemon_cache: Dict[int, Dict] = {}
 species_cache: Dict[int, Dict] = {}
-evolution_cache: Dict[int, List[int]] = {}
+evolution_cache: Dict[str, List[int]] = {}  # keyed by evolution chain URL
+_id_to_chain_url: Dict[int, str] = {}
+_fully_evolved_cache: Dict[int, bool] = {}
+_type_mask: Dict[int, int] = {}
 sprite_cache: Dict[str, ImageTk.PhotoImage] = {}
 
+# Set whenever a cache gains new entries; cleared by the background flusher
+_cache_dirty = threading.Event()
+_save_lock = threading.Lock()
+
+# Fetches currently running, keyed by (fetch function, Pokemon ID)
+_inflight: Dict[Tuple[Callable, int], concurrent.futures.Future] = {}
+_inflight_lock = threading.Lock()
+
+# Per-thread connections to the sprite store
+_sprite_db = threading.local()
+
+# Pokemon name -> Pokedex number, filled once from the dropdown list in main()
+_POKEMON_NAME_TO_ID: Dict[str, int] = {}
+
 class DraculaTheme:
     """Dracula color theme constants"""
     BACKGROUND = "#282a36"
@@ -43,81 +119,114 @@ class DraculaTheme:
 
 def load_cache():
     """Load cached data from files."""
-    global pokemon_cache, species_cache
+    global pokemon_cache, species_cache, evolution_cache
     try:
         if os.path.exists(DATA_CACHE_FILE):
-            with open(DATA_CACHE_FILE, 'r') as f:
-                pokemon_cache = json.load(f)
+            with open(DATA_CACHE_FILE, 'rb') as f:
+                pokemon_cache = pickle.load(f)
         if os.path.exists(SPECIES_CACHE_FILE):
-            with open(SPECIES_CACHE_FILE, 'r') as f:
-                species_cache = json.load(f)
+            with open(SPECIES_CACHE_FILE, 'rb') as f:
+                species_cache = pickle.load(f)
+        if os.path.exists(EVOLUTION_CACHE_FILE):
+            with open(EVOLUTION_CACHE_FILE, 'rb') as f:
+                evolution_cache = pickle.load(f)
+            for chain_url, evolution_chain in evolution_cache.items():
+                for member_id in evolution_chain:
+                    _id_to_chain_url[member_id] = chain_url
     except Exception as e:
         print(f"Error loading cache: {e}")
 
 def save_cache():
     """Save cached data to files."""
     try:
-        with open(DATA_CACHE_FILE, 'w') as f:
-            json.dump(pokemon_cache, f)
-        with open(SPECIES_CACHE_FILE, 'w') as f:
-            json.dump(species_cache, f)
+        with _save_lock:
+            # Snapshot the dicts so worker threads can keep inserting while we write
+            with open(DATA_CACHE_FILE, 'wb') as f:
+                pickle.dump(dict(pokemon_cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(SPECIES_CACHE_FILE, 'wb') as f:
+                pickle.dump(dict(species_cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(EVOLUTION_CACHE_FILE, 'wb') as f:
+                pickle.dump(dict(evolution_cache), f, protocol=pickle.HIGHEST_PROTOCOL)
     except Exception as e:
         print(f"Error saving cache: {e}")
 
-def get_sprite_path(url: str) -> str:
-    """Get the local path for a sprite URL."""
-    return os.path.join(SPRITE_CACHE_DIR, url.split('/')[-1])
+def cache_flusher():
+    """Save dirty caches in the background, at most once per flush interval."""
+    while True:
+        _cache_dirty.wait()
+        time.sleep(CACHE_FLUSH_INTERVAL)
+        _cache_dirty.clear()
+        save_cache()
 
-def load_sprite(url: str, size: Tuple[int, int] = (150, 150)) -> Optional[ImageTk.PhotoImage]:
-    """Load a sprite from cache or download it."""
-    if url in sprite_cache:
-        return sprite_cache[url]
+def get_sprite_db() -> sqlite3.Connection:
+    """Get this thread's connection to the sprite store, creating it on first use."""
+    conn = getattr(_sprite_db, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(SPRITE_DB_FILE, timeout=REQUEST_TIMEOUT)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS sprites(url TEXT PRIMARY KEY, png BLOB)")
+        conn.execute("CREATE TABLE IF NOT EXISTS resized_sprites("
+                     "url TEXT, width INTEGER, height INTEGER, png BLOB, "
+                     "PRIMARY KEY (url, width, height))")
+        _sprite_db.conn = conn
+    return conn
+
+def download_sprite(url: str) -> Optional[bytes]:
+    """Get the original sprite bytes from the sprite store or download them."""
+    conn = get_sprite_db()
+    row = conn.execute("SELECT png FROM sprites WHERE url = ?", (url,)).fetchone()
+    if row:
+        return row[0]
     
-    sprite_path = get_sprite_path(url)
     try:
-        if os.path.exists(sprite_path):
-            image = Image.open(sprite_path)
-        else:
-            response = requests.get(url)
-            response.raise_for_status()
-            image = Image.open(BytesIO(response.content))
-            image.save(sprite_path)
-        
-        image = image.resize(size, Image.Resampling.LANCZOS)
-        photo = ImageTk.PhotoImage(image)
-        sprite_cache[url] = photo
-        return photo
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO sprites(url, png) VALUES (?, ?)", (url, response.content))
+        return response.content
+    except (requests.exceptions.RequestException, sqlite3.Error) as e:
+        print(f"Error downloading sprite: {e}")
+        return None
+
+def decode_sprite(url: str, size: Tuple[int, int] = (150, 150)) -> Optional[Image.Image]:
+    """Download, decode and resize a sprite. Safe to run in worker threads."""
+    try:
+        conn = get_sprite_db()
+        row = conn.execute("SELECT png FROM resized_sprites WHERE url = ? AND width = ? AND height = ?",
+                           (url, size[0], size[1])).fetchone()
+        if row:
+            image = Image.open(BytesIO(row[0]))
+            image.load()
+            return image
+        
+        png = download_sprite(url)
+        if png is None:
+            return None
+        
+        # Resize once and keep the result so later runs skip resampling
+        image = Image.open(BytesIO(png)).convert("RGBA")
+        image = image.resize(size, Image.Resampling.BILINEAR)
+        buffer = BytesIO()
+        image.save(buffer, format='PNG')
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO resized_sprites(url, width, height, png) VALUES (?, ?, ?, ?)",
+                         (url, size[0], size[1], buffer.getvalue()))
+        return image
     except Exception as e:
         print(f"Error loading sprite: {e}")
         return None
 
-def prefetch_pokemon_data(pokemon_ids: List[int]):
-    """Prefetch Pokemon data in parallel."""
-    def fetch_single_pokemon(pokemon_id: int):
-        if pokemon_id not in pokemon_cache:
-            try:
-                response = requests.get(f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}")
-                response.raise_for_status()
-                pokemon_cache[pokemon_id] = response.json()
-            except Exception:
-                pass
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        executor.map(fetch_single_pokemon, pokemon_ids)
-
-def prefetch_species_data(pokemon_ids: List[int]):
-    """Prefetch species data in parallel."""
-    def fetch_single_species(pokemon_id: int):
-        if pokemon_id not in species_cache:
-            try:
-                response = requests.get(f"https://pokeapi.co/api/v2/pokemon-species/{pokemon_id}")
-                response.raise_for_status()
-                species_cache[pokemon_id] = response.json()
-            except Exception:
-                pass
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        executor.map(fetch_single_species, pokemon_ids)
+def to_photoimage(url: str, image: Optional[Image.Image]) -> Optional[ImageTk.PhotoImage]:
+    """Wrap a decoded sprite for Tk. Must run on the Tk main thread."""
+    if url in sprite_cache:
+        return sprite_cache[url]
+    if image is None:
+        return None
+    
+    photo = ImageTk.PhotoImage(image)
+    sprite_cache[url] = photo
+    return photo
 
 class GenerationSelector(tk.Frame):
     def __init__(self, master):
@@ -162,42 +271,101 @@ class PokemonSelector(ttk.Combobox):
         self['values'] = [''] + pokemon_list
         self.set('')
 
-def get_pokemon_data(pokemon_id: int) -> Dict:
-    """Fetch Pokemon data from cache or PokeAPI."""
-    if pokemon_id in pokemon_cache:
-        return pokemon_cache[pokemon_id]
+def trim_pokemon_data(data: Dict) -> Dict:
+    """Keep only the /pokemon fields the generator uses."""
+    return {
+        'id': data['id'],
+        'name': data['name'],
+        'height': data['height'],
+        'weight': data['weight'],
+        'types': [{'type': {'name': t['type']['name']}} for t in data['types']],
+        'sprites': {
+            'front_default': data['sprites']['front_default'],
+            'front_shiny': data['sprites']['front_shiny']
+        }
+    }
+
+def trim_species_data(data: Dict) -> Dict:
+    """Keep only the /pokemon-species fields the generator uses."""
+    return {
+        'names': [name for name in data['names'] if name['language']['name'] == 'de'],
+        'evolution_chain': data.get('evolution_chain')
+    }
+
+def fetch_once(cache: Dict, fetch: Callable[[int], Optional[Dict]], pokemon_id: int) -> Optional[Dict]:
+    """Get a cache entry, letting concurrent callers for the same ID share one fetch."""
+    key = (fetch, pokemon_id)
+    with _inflight_lock:
+        if pokemon_id in cache:
+            return cache[pokemon_id]
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight[key] = concurrent.futures.Future()
+    
+    if not is_owner:
+        return future.result()
     
+    try:
+        data = fetch(pokemon_id)
+        future.set_result(data)
+        return data
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+def fetch_pokemon_data(pokemon_id: int) -> Optional[Dict]:
+    """Fetch Pokemon data from PokeAPI and store it in the cache."""
     url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}"
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = trim_pokemon_data(orjson.loads(response.content))
         pokemon_cache[pokemon_id] = data
+        _cache_dirty.set()
         return data
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(f"Error fetching Pokemon data: {e}")
         return None
 
-def get_pokemon_species_data(pokemon_id: int) -> Dict:
-    """Fetch Pokemon species data from cache or PokeAPI."""
-    if pokemon_id in species_cache:
-        return species_cache[pokemon_id]
-    
+def fetch_pokemon_species_data(pokemon_id: int) -> Optional[Dict]:
+    """Fetch Pokemon species data from PokeAPI and store it in the cache."""
     url = f"https://pokeapi.co/api/v2/pokemon-species/{pokemon_id}"
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = trim_species_data(orjson.loads(response.content))
         species_cache[pokemon_id] = data
+        _cache_dirty.set()
         return data
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(f"Error fetching Pokemon species data: {e}")
         return None
 
+def get_pokemon_data(pokemon_id: int) -> Dict:
+    """Fetch Pokemon data from cache or PokeAPI."""
+    if pokemon_id in pokemon_cache:
+        return pokemon_cache[pokemon_id]
+    return fetch_once(pokemon_cache, fetch_pokemon_data, pokemon_id)
+
+def get_pokemon_species_data(pokemon_id: int) -> Dict:
+    """Fetch Pokemon species data from cache or PokeAPI."""
+    if pokemon_id in species_cache:
+        return species_cache[pokemon_id]
+    return fetch_once(species_cache, fetch_pokemon_species_data, pokemon_id)
+
+def id_from_url(url: str) -> int:
+    """Extract the numeric ID from a PokeAPI resource URL."""
+    return int(url.rstrip('/').rsplit('/', 1)[-1])
+
 def get_evolution_chain(pokemon_id: int) -> List[int]:
     """Get the evolution chain for a Pokemon."""
-    if pokemon_id in evolution_cache:
-        return evolution_cache[pokemon_id]
+    chain_url = _id_to_chain_url.get(pokemon_id)
+    if chain_url in evolution_cache:
+        return evolution_cache[chain_url]
     
     species_data = get_pokemon_species_data(pokemon_id)
     if not species_data:
@@ -205,103 +373,121 @@ def get_evolution_chain(pokemon_id: int) -> List[int]:
     
     try:
         evolution_url = species_data['evolution_chain']['url']
-        response = requests.get(evolution_url)
+        if evolution_url in evolution_cache:
+            _id_to_chain_url[pokemon_id] = evolution_url
+            return evolution_cache[evolution_url]
+        
+        response = SESSION.get(evolution_url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        evolution_data = response.json()
+        evolution_data = orjson.loads(response.content)
         
+        # Walk the chain depth-first in pre-order (children pushed reversed to keep their order)
         evolution_chain = []
-        def extract_chain(chain_data):
-            species_url = chain_data['species']['url']
-            pokemon_id = int(species_url.split('/')[-2])
-            evolution_chain.append(pokemon_id)
-            
-            for evolved in chain_data.get('evolves_to', []):
-                extract_chain(evolved)
+        stack = [evolution_data['chain']]
+        while stack:
+            chain_data = stack.pop()
+            member_id = id_from_url(chain_data['species']['url'])
+            evolution_chain.append(member_id)
+            _id_to_chain_url[member_id] = evolution_url
+            stack.extend(reversed(chain_data.get('evolves_to', [])))
         
-        extract_chain(evolution_data['chain'])
-        evolution_cache[pokemon_id] = evolution_chain
+        evolution_cache[evolution_url] = evolution_chain
+        _cache_dirty.set()
         return evolution_chain
-    except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+    except (requests.exceptions.RequestException, KeyError, TypeError, ValueError) as e:
         print(f"Error getting evolution chain: {e}")
         return []
 
 def is_fully_evolved(pokemon_id: int) -> bool:
     """Check if a Pokemon is fully evolved."""
+    if pokemon_id in _fully_evolved_cache:
+        return _fully_evolved_cache[pokemon_id]
+    
     evolution_chain = get_evolution_chain(pokemon_id)
     if not evolution_chain:
         return True
-    return pokemon_id == evolution_chain[-1]
+    result = pokemon_id == evolution_chain[-1]
+    _fully_evolved_cache[pokemon_id] = result
+    return result
 
 def is_legendary(pokemon_id: int) -> bool:
     """Check if a Pokemon is legendary or mythical."""
-    species_data = get_pokemon_species_data(pokemon_id)
-    if not species_data:
-        return False
-    return species_data.get('is_legendary', False) or species_data.get('is_mythical', False)
+    return pokemon_id in LEGENDARY_IDS
 
 def get_all_pokemon() -> List[str]:
     """Get a list of all Pokemon names."""
     try:
-        response = requests.get("https://pokeapi.co/api/v2/pokemon?limit=1025")
+        response = SESSION.get("https://pokeapi.co/api/v2/pokemon?limit=1025", timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return [p['name'].capitalize() for p in data['results']]
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(f"Error fetching Pokemon list: {e}")
         return []
 
+def get_type_mask(pokemon_data: Dict) -> int:
+    """Get the type bitmask of a Pokemon, computed once per ID."""
+    pokemon_id = pokemon_data['id']
+    mask = _type_mask.get(pokemon_id)
+    if mask is None:
+        mask = 0
+        for t in pokemon_data['types']:
+            mask |= TYPE_BIT.get(t['type']['name'], 0)
+        _type_mask[pokemon_id] = mask
+    return mask
+
+def iter_shuffled(items: List[int]) -> Iterator[int]:
+    """Yield items in random order, shuffling lazily (Fisher-Yates) as they are consumed."""
+    for i in range(len(items) - 1, -1, -1):
+        j = random.randint(0, i)
+        items[i], items[j] = items[j], items[i]
+        yield items[i]
+
 def get_random_pokemon(selected_generations: List[int], 
-                      existing_types: Set[str] = None,
+                      existing_type_mask: Optional[int] = None,
                       evolution_filter: bool = False,
                       exclude_legendary: bool = False) -> Optional[Dict]:
     """Get a random Pokemon that meets the filter criteria."""
-    # Define generation ranges
-    gen_ranges = {
-        1: (1, 151),
-        2: (152, 251),
-        3: (252, 386),
-        4: (387, 493),
-        5: (494, 649),
-        6: (650, 721),
-        7: (722, 809),
-        8: (810, 905),
-        9: (906, 1025)
-    }
-    
     # Get all valid Pokemon IDs based on selected generations
-    valid_ids = []
-    for gen in selected_generations:
-        start, end = gen_ranges[gen]
-        valid_ids.extend(range(start, end + 1))
+    valid_ids = list(itertools.chain.from_iterable(
+        range(GEN_RANGES[gen][0], GEN_RANGES[gen][1] + 1) for gen in selected_generations
+    ))
     
     if not valid_ids:
         return None
     
-    # Shuffle the valid IDs
-    random.shuffle(valid_ids)
-    
-    # Try Pokemon until we find one that meets all criteria
-    for pokemon_id in valid_ids:
+    def probe(pokemon_id: int) -> Optional[Dict]:
+        """Fetch a candidate and return its data if it meets all criteria."""
         pokemon_data = get_pokemon_data(pokemon_id)
         if not pokemon_data:
-            continue
+            return None
         
         # Check evolution filter
         if evolution_filter and not is_fully_evolved(pokemon_id):
-            continue
+            return None
         
         # Check legendary filter
         if exclude_legendary and is_legendary(pokemon_id):
-            continue
+            return None
         
         # Check type filter
-        if existing_types is not None:
-            pokemon_types = {t['type']['name'] for t in pokemon_data['types']}
-            if pokemon_types & existing_types:
-                continue
+        if existing_type_mask is not None and get_type_mask(pokemon_data) & existing_type_mask:
+            return None
         
         return pokemon_data
     
+    # Probe candidates in parallel batches and take the first match in shuffled order,
+    # so each batch costs one round trip instead of one per candidate
+    # Leftover probes of a batch keep running in the pool and just warm the caches
+    candidates = iter_shuffled(valid_ids)
+    while True:
+        batch = list(itertools.islice(candidates, PROBE_BATCH_SIZE))
+        if not batch:
+            break
+        for pokemon_data in _IO_POOL.map(probe, batch):
+            if pokemon_data:
+                return pokemon_data
+    
     return None
 
 class LoadingIndicator(tk.Canvas):
@@ -386,6 +572,70 @@ class LoadingFrame(tk.Frame):
         self.indicator.stop()
         self.destroy()
 
+class PokemonDisplay(tk.Frame):
+    def __init__(self, master):
+        super().__init__(master,
+                         bg=DraculaTheme.CURRENT_LINE,
+                         padx=10, pady=10,
+                         relief=tk.RAISED,
+                         borderwidth=1)
+        
+        # Create labels once; show() only reconfigures them
+        self.image_label = tk.Label(self, bg=DraculaTheme.CURRENT_LINE)
+        self.image_label.pack()
+        
+        self.name_label = tk.Label(self,
+                                   font=('Arial', 12, 'bold'),
+                                   bg=DraculaTheme.CURRENT_LINE)
+        self.name_label.pack()
+        
+        self.number_label = tk.Label(self,
+                                     font=('Arial', 10),
+                                     bg=DraculaTheme.CURRENT_LINE,
+                                     fg=DraculaTheme.COMMENT)
+        self.number_label.pack()
+        
+        self.type_label = tk.Label(self,
+                                   font=('Arial', 10),
+                                   bg=DraculaTheme.CURRENT_LINE,
+                                   fg=DraculaTheme.ORANGE)
+        self.type_label.pack()
+        
+        self.size_label = tk.Label(self,
+                                   font=('Arial', 10),
+                                   bg=DraculaTheme.CURRENT_LINE,
+                                   fg=DraculaTheme.CYAN)
+        self.size_label.pack()
+        
+        self.weight_label = tk.Label(self,
+                                     font=('Arial', 10),
+                                     bg=DraculaTheme.CURRENT_LINE,
+                                     fg=DraculaTheme.CYAN)
+        self.weight_label.pack()
+    
+    def set_image(self, photo: Optional[ImageTk.PhotoImage]):
+        self.image_label.configure(image=photo or '')
+        self.image_label.image = photo
+    
+    def show(self, pokemon_data: Dict, german_name: str, is_shiny: bool,
+             photo: Optional[ImageTk.PhotoImage]):
+        self.set_image(photo)
+        self.name_label.configure(text=f"{german_name} {'✨' if is_shiny else ''}",
+                                  font=('Arial', 12, 'bold'),
+                                  fg=DraculaTheme.GREEN if is_shiny else DraculaTheme.PINK)
+        self.number_label.configure(text=f"#{pokemon_data['id']}")
+        self.type_label.configure(text=f"Typ: {' / '.join(t['type']['name'].capitalize() for t in pokemon_data['types'])}")
+        self.size_label.configure(text=f"Größe: {pokemon_data['height']/10:.1f}m")
+        self.weight_label.configure(text=f"Gewicht: {pokemon_data['weight']/10:.1f}kg")
+    
+    def show_error(self, pokemon_name: str, photo: Optional[ImageTk.PhotoImage]):
+        self.set_image(photo)
+        self.name_label.configure(text=f"Error displaying\n{pokemon_name}",
+                                  font=('Arial', 10),
+                                  fg=DraculaTheme.RED)
+        for label in (self.number_label, self.type_label, self.size_label, self.weight_label):
+            label.configure(text='')
+
 def show_pokemon():
     """Display the selected Pokemon team."""
     # Show loading indicator
@@ -394,10 +644,8 @@ def show_pokemon():
     loading_frame.start()
     window.update()
     
-    # Clear previous Pokemon display
-    for widget in pokemon_frame.winfo_children():
-        if widget != loading_frame:
-            widget.destroy()
+    # Hide previous Pokemon display
+    team_frame.pack_forget()
     
     # Get selected generations
     selected_generations = generation_selector.get_selected_generations()
@@ -408,57 +656,34 @@ def show_pokemon():
     
     def generate_pokemon_team():
         """Generate Pokemon team in background thread."""
-        # Prefetch Pokemon data for selected generations
-        gen_ranges = {
-            1: (1, 151),
-            2: (152, 251),
-            3: (252, 386),
-            4: (387, 493),
-            5: (494, 649),
-            6: (650, 721),
-            7: (722, 809),
-            8: (810, 905),
-            9: (906, 1025)
-        }
-        
-        pokemon_ids = []
-        for gen in selected_generations:
-            start, end = gen_ranges[gen]
-            pokemon_ids.extend(range(start, end + 1))
-        
-        # Prefetch data in background
-        prefetch_pokemon_data(pokemon_ids)
-        prefetch_species_data(pokemon_ids)
-        
         # Get manually selected Pokemon
         selected_pokemon = []
-        selected_types = set()
+        selected_type_mask = 0
         
         for selector in pokemon_selectors:
             pokemon_name = selector.get()
             if pokemon_name:
-                try:
-                    pokemon_id = get_all_pokemon().index(pokemon_name) + 1
-                    pokemon_data = get_pokemon_data(pokemon_id)
-                    if pokemon_data:
-                        # Check legendary filter for manually selected Pokemon
-                        if legendary_filter_var.get() and is_legendary(pokemon_id):
-                            window.after(0, lambda: messagebox.showwarning(
-                                "Warnung",
-                                f"Das Pokemon {pokemon_name} ist legendär/mystisch und wird bei aktiviertem Legendär-Filter übersprungen!"
-                            ))
-                            continue
-                        selected_pokemon.append(pokemon_data)
-                        if type_filter_var.get():
-                            selected_types.update(t['type']['name'] for t in pokemon_data['types'])
-                except ValueError:
+                pokemon_id = _POKEMON_NAME_TO_ID.get(pokemon_name)
+                if pokemon_id is None:
                     continue
+                pokemon_data = get_pokemon_data(pokemon_id)
+                if pokemon_data:
+                    # Check legendary filter for manually selected Pokemon
+                    if legendary_filter_var.get() and is_legendary(pokemon_id):
+                        window.after(0, lambda: messagebox.showwarning(
+                            "Warnung",
+                            f"Das Pokemon {pokemon_name} ist legendär/mystisch und wird bei aktiviertem Legendär-Filter übersprungen!"
+                        ))
+                        continue
+                    selected_pokemon.append(pokemon_data)
+                    if type_filter_var.get():
+                        selected_type_mask |= get_type_mask(pokemon_data)
         
         # Fill remaining slots with random Pokemon
         while len(selected_pokemon) < 6:
             pokemon_data = get_random_pokemon(
                 selected_generations,
-                selected_types if type_filter_var.get() else None,
+                selected_type_mask if type_filter_var.get() else None,
                 evolution_filter_var.get(),
                 legendary_filter_var.get()
             )
@@ -472,112 +697,58 @@ def show_pokemon():
             
             selected_pokemon.append(pokemon_data)
             if type_filter_var.get():
-                selected_types.update(t['type']['name'] for t in pokemon_data['types'])
+                selected_type_mask |= get_type_mask(pokemon_data)
+        
+        # Roll shiny status and prepare all sprites concurrently before touching the UI
+        team = []
+        for pokemon_data in selected_pokemon:
+            # Determine if Pokemon should be shiny (10% chance)
+            is_shiny = random.random() < 0.1
+            sprite_url = (pokemon_data['sprites']['front_shiny'] if is_shiny and pokemon_data['sprites']['front_shiny']
+                        else pokemon_data['sprites']['front_default'])
+            team.append((pokemon_data, is_shiny, sprite_url))
+        
+        sprite_urls = list({sprite_url for _, _, sprite_url in team
+                            if sprite_url and sprite_url not in sprite_cache})
+        sprite_futures = [_IO_POOL.submit(decode_sprite, sprite_url) for sprite_url in sprite_urls]
+        # Species data is needed for the German names; fetch it here rather than on the Tk thread
+        species_futures = [_IO_POOL.submit(get_pokemon_species_data, pokemon_data['id'])
+                           for pokemon_data in selected_pokemon]
+        concurrent.futures.wait(sprite_futures + species_futures)
+        sprite_images = {sprite_url: future.result() for sprite_url, future in zip(sprite_urls, sprite_futures)}
         
         # Update UI in main thread
         def update_ui():
             nonlocal loading_frame
             
-            # Create frame for each row (3 Pokemon per row)
-            for row in range(2):
-                row_frame = tk.Frame(pokemon_frame, bg=DraculaTheme.BACKGROUND)
-                row_frame.pack(pady=10)
+            # Fill the persistent display slots (3 Pokemon per row)
+            for idx, pokemon_display in enumerate(pokemon_displays):
+                if idx >= len(team):
+                    pokemon_display.pack_forget()
+                    continue
+                
+                pokemon_data, is_shiny, sprite_url = team[idx]
+                
+                # Wrap the pre-decoded sprite for Tk
+                photo = to_photoimage(sprite_url, sprite_images.get(sprite_url)) if sprite_url else None
+                
+                try:
+                    # Get German name
+                    species_data = get_pokemon_species_data(pokemon_data['id'])
+                    german_name = next((name['name'] for name in species_data['names'] 
+                                    if name['language']['name'] == 'de'), 
+                                    pokemon_data['name'].capitalize())
+                    pokemon_display.show(pokemon_data, german_name, is_shiny, photo)
+                except Exception as e:
+                    print(f"Error displaying Pokemon: {e}")
+                    pokemon_display.show_error(pokemon_data['name'], photo)
                 
-                for col in range(3):
-                    idx = row * 3 + col
-                    if idx >= len(selected_pokemon):
-                        break
-                    
-                    pokemon_data = selected_pokemon[idx]
-                    
-                    # Create frame for this Pokemon
-                    pokemon_display = tk.Frame(row_frame, 
-                                            bg=DraculaTheme.CURRENT_LINE,
-                                            padx=10, pady=10,
-                                            relief=tk.RAISED,
-                                            borderwidth=1)
-                    pokemon_display.pack(side=tk.LEFT, padx=10)
-                    
-                    # Determine if Pokemon should be shiny (10% chance)
-                    is_shiny = random.random() < 0.1
-                    
-                    # Get sprite URL
-                    sprite_url = (pokemon_data['sprites']['front_shiny'] if is_shiny and pokemon_data['sprites']['front_shiny']
-                                else pokemon_data['sprites']['front_default'])
-                    
-                    # Load sprite
-                    photo = load_sprite(sprite_url)
-                    if photo:
-                        image_label = tk.Label(pokemon_display,
-                                             image=photo,
-                                             bg=DraculaTheme.CURRENT_LINE)
-                        image_label.image = photo
-                        image_label.pack()
-                    
-                    try:
-                        # Get German name
-                        species_data = get_pokemon_species_data(pokemon_data['id'])
-                        german_name = next((name['name'] for name in species_data['names'] 
-                                        if name['language']['name'] == 'de'), 
-                                        pokemon_data['name'].capitalize())
-                        
-                        # Create text with Pokemon info
-                        name_text = f"{german_name} {'✨' if is_shiny else ''}"
-                        number_text = f"#{pokemon_data['id']}"
-                        type_text = f"Typ: {' / '.join(t['type']['name'].capitalize() for t in pokemon_data['types'])}"
-                        size_text = f"Größe: {pokemon_data['height']/10:.1f}m"
-                        weight_text = f"Gewicht: {pokemon_data['weight']/10:.1f}kg"
-                        
-                        # Create and pack info labels with different colors
-                        name_label = tk.Label(pokemon_display,
-                                           text=name_text,
-                                           font=('Arial', 12, 'bold'),
-                                           bg=DraculaTheme.CURRENT_LINE,
-                                           fg=DraculaTheme.GREEN if is_shiny else DraculaTheme.PINK)
-                        name_label.pack()
-                        
-                        number_label = tk.Label(pokemon_display,
-                                             text=number_text,
-                                             font=('Arial', 10),
-                                             bg=DraculaTheme.CURRENT_LINE,
-                                             fg=DraculaTheme.COMMENT)
-                        number_label.pack()
-                        
-                        type_label = tk.Label(pokemon_display,
-                                           text=type_text,
-                                           font=('Arial', 10),
-                                           bg=DraculaTheme.CURRENT_LINE,
-                                           fg=DraculaTheme.ORANGE)
-                        type_label.pack()
-                        
-                        size_label = tk.Label(pokemon_display,
-                                           text=size_text,
-                                           font=('Arial', 10),
-                                           bg=DraculaTheme.CURRENT_LINE,
-                                           fg=DraculaTheme.CYAN)
-                        size_label.pack()
-                        
-                        weight_label = tk.Label(pokemon_display,
-                                             text=weight_text,
-                                             font=('Arial', 10),
-                                             bg=DraculaTheme.CURRENT_LINE,
-                                             fg=DraculaTheme.CYAN)
-                        weight_label.pack()
-                        
-                    except Exception as e:
-                        print(f"Error displaying Pokemon: {e}")
-                        error_label = tk.Label(pokemon_display, 
-                                             text=f"Error displaying\n{pokemon_data['name']}", 
-                                             font=('Arial', 10),
-                                             bg=DraculaTheme.CURRENT_LINE,
-                                             fg=DraculaTheme.RED)
-                        error_label.pack()
+                pokemon_display.pack(side=tk.LEFT, padx=10)
+            
+            team_frame.pack(fill=tk.BOTH, expand=True)
             
             # Stop and remove loading indicator
             loading_frame.stop()
-            
-            # Save cache after successful operation
-            save_cache()
         
         # Schedule UI update in main thread
         window.after(0, update_ui)
@@ -588,10 +759,11 @@ def show_pokemon():
     thread.start()
 
 def main():
-    global pokemon_frame, pokemon_selectors, generation_selector, type_filter_var, evolution_filter_var, legendary_filter_var, window
+    global pokemon_frame, team_frame, pokemon_displays, pokemon_selectors, generation_selector, type_filter_var, evolution_filter_var, legendary_filter_var, window
     
-    # Load cached data
+    # Load cached data and start the background cache writer
     load_cache()
+    threading.Thread(target=cache_flusher, daemon=True).start()
     
     window = tk.Tk()
     window.title("Pokémon Team Generator")
@@ -715,6 +887,7 @@ def main():
     
     # Get Pokemon list for dropdowns
     pokemon_list = get_all_pokemon()
+    _POKEMON_NAME_TO_ID.update({name: i + 1 for i, name in enumerate(pokemon_list)})
     
     # Create 6 Pokemon selectors
     pokemon_selectors = []
@@ -727,6 +900,15 @@ def main():
     global pokemon_frame
     pokemon_frame = tk.Frame(main_container, bg=DraculaTheme.BACKGROUND)
     pokemon_frame.pack(fill=tk.BOTH, expand=True)
+    
+    # Create the team display once (2 rows of 3 slots); show_pokemon only updates it
+    team_frame = tk.Frame(pokemon_frame, bg=DraculaTheme.BACKGROUND)
+    pokemon_displays = []
+    for row in range(2):
+        row_frame = tk.Frame(team_frame, bg=DraculaTheme.BACKGROUND)
+        row_frame.pack(pady=10)
+        for col in range(3):
+            pokemon_displays.append(PokemonDisplay(row_frame))
 
     # Create generate button
     generate_button = tk.Button(main_container, 
@@ -741,6 +923,13 @@ def main():
                               relief=tk.FLAT)
     generate_button.pack(pady=(0, 20))
 
+    # Persist caches once when the window is closed
+    def on_close():
+        save_cache()
+        window.destroy()
+    
+    window.protocol("WM_DELETE_WINDOW", on_close)
+
     window.mainloop()
 
 if __name__ == "__main__":